@@ -11,28 +11,107 @@ automated power supply control workflows through the MCP protocol.
 
 from fastmcp import FastMCP
 import asyncio
+import functools
+import ipaddress
 import logging
 import os
+import threading
+import time
 from typing import Optional, Dict, Any, List
 from rigol_dp832.rigol_dp import DP832, DP821, DP712
-from rigol_dp832.find_dp832 import find_dp832
-from rigol_dp832.test_ip import test_ip
+from rigol_dp832.find_dp832 import get_local_networks
+
+# orjson encodes the small numeric result dicts several times faster than
+# the stdlib json encoder; it's optional, so fall back silently without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize the MCP server with a descriptive name
-mcp = FastMCP(name="RigolDP832MCP")
+if orjson is not None:
+    def _serialize_result(data: Any) -> str:
+        """Encode a tool result with orjson (FastMCP expects str, not bytes)."""
+        return orjson.dumps(data).decode()
+
+    mcp = FastMCP(name="RigolDP832MCP", tool_serializer=_serialize_result)
+else:
+    mcp = FastMCP(name="RigolDP832MCP")
+
+class _ConnRef:
+    """
+    Holder for the default instrument connection.
+
+    Tools fetch the live session with require(), which replaces the
+    global-lookup-plus-truthiness guard that used to be pasted into every
+    tool with a single attribute load that raises when nothing is connected.
+    """
+    __slots__ = ("ps", "conn_str", "channels", "bad_channel_error", "id_info",
+                 "keepalive")
+
+    def __init__(self):
+        self.ps = None
+        self.conn_str = None
+        self.channels = None
+        self.bad_channel_error = None
+        self.id_info = None
+        self.keepalive = None
+
+    def require(self):
+        ps = self.ps
+        if ps is None:
+            raise RuntimeError("No device connected. Use connect() first.")
+        return ps
+
+
+# Default connection handle; connect()/disconnect() point it into the pool
+_conn = _ConnRef()
+
+# Channel numbers each supported model accepts; used to reject bad channel
+# arguments locally instead of letting the instrument do it over the wire
+_VALID_CHANNELS = {
+    "DP832": frozenset({1, 2, 3}),
+    "DP821": frozenset({1, 2}),
+    "DP712": frozenset({1}),
+}
+
 
-# Global variable to store the current power supply connection
-current_ps: Optional[Any] = None
+def _check_channel(channel):
+    """
+    Reject an invalid channel number before any SCPI traffic.
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+    Uses the channel set detected at connect() time, so a wrong channel
+    costs a set lookup and a pre-built error message rather than an
+    instrument round-trip.
+    """
+    channels = _conn.channels
+    if channels is not None and channel not in channels:
+        raise ValueError(_conn.bad_channel_error)
+
+# Pool of warm VISA sessions keyed by connection string. Opening a
+# TCPIP::SOCKET resource pays a TCP handshake plus instrument init, so
+# sessions are kept open between tool calls and reaped after sitting idle.
+_pool: Dict[str, list] = {}
+_pool_lock = threading.Lock()
+_POOL_IDLE_TIMEOUT = 60.0
+_reaper_started = False
+
+# Set up logging. As a library the module stays silent (NullHandler);
+# main() installs a real handler when run as a server. Log calls use
+# deferred %s formatting so disabled levels cost only the level check.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Configuration
 DEFAULT_IP = os.environ.get("RIGOL_DP832_IP")
 DEFAULT_PORT = int(os.environ.get("RIGOL_DP832_PORT", "5555"))
 
+# Connection-string template with the configured port baked in, so the
+# common default-port case only substitutes the IP
+_CONN_TEMPLATE = f"TCPIP0::{{ip}}::{DEFAULT_PORT}::SOCKET"
+
 
+@functools.lru_cache(maxsize=32)
 def get_connection_string(ip: Optional[str] = None, port: Optional[int] = None) -> str:
     """
     Get the VISA connection string for the power supply.
@@ -46,35 +125,192 @@ def get_connection_string(ip: Optional[str] = None, port: Optional[int] = None)
     """
     if ip is None:
         ip = DEFAULT_IP
-    if port is None:
-        port = DEFAULT_PORT
-    
     if ip is None:
         raise ValueError("No IP address configured. Set RIGOL_DP832_IP environment variable or provide IP parameter.")
     
+    if port is None or port == DEFAULT_PORT:
+        return _CONN_TEMPLATE.format(ip=ip)
     return f"TCPIP0::{ip}::{port}::SOCKET"
 
 
+def _reap_idle_sessions():
+    """Close pooled sessions that have sat idle past the timeout"""
+    while True:
+        time.sleep(_POOL_IDLE_TIMEOUT / 2)
+        now = time.monotonic()
+        with _pool_lock:
+            expired = [
+                conn_str
+                for conn_str, (ps, last_used) in _pool.items()
+                if ps is not _conn.ps and now - last_used > _POOL_IDLE_TIMEOUT
+            ]
+            for conn_str in expired:
+                ps, _ = _pool.pop(conn_str)
+                try:
+                    ps.close()
+                except Exception:
+                    pass
+
+
+# One asyncio.Lock per connection string so concurrent tool calls against the
+# same instrument queue instead of interleaving on its socket
+_instrument_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _lock_for(connection_string: Optional[str]) -> asyncio.Lock:
+    """Get (or create) the per-instrument lock for a connection string"""
+    key = connection_string or ""
+    lock = _instrument_locks.get(key)
+    if lock is None:
+        lock = _instrument_locks.setdefault(key, asyncio.Lock())
+    return lock
+
+
+def _tool_result(fn):
+    """
+    Wrap a tool so it returns the standard status envelope.
+
+    The tool body returns just its payload dict; this adds
+    {"status": "success"} on the way out and turns instrument errors into
+    {"status": "error", "error": ...} in one place instead of a try/except
+    block per tool. The no-device RuntimeError still propagates, matching
+    each tool's documented behavior.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return {"status": "success", **(await fn(*args, **kwargs))}
+        except RuntimeError:
+            raise
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+    return wrapper
+
+
+async def _call_ps(fn, *args, **kwargs):
+    """
+    Run a blocking instrument call without stalling the event loop.
+
+    The call runs in a worker thread and is serialized against other calls
+    to the currently connected instrument.
+    """
+    async with _lock_for(_conn.conn_str):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+# How often the keepalive task touches an otherwise idle session. Below the
+# instrument's ~30-60s TCP idle timeout, so the socket never goes cold.
+_KEEPALIVE_INTERVAL = 20.0
+
+
+async def _keepalive(connection_string: str, ps) -> None:
+    """
+    Periodically ping an idle session so the instrument keeps the socket up.
+
+    Without this, the DP832 drops idle TCP connections and the next tool
+    call pays a full reconnect. The ping shares the per-connection lock, so
+    it never interleaves with real traffic. Exits quietly once the session
+    is replaced or the ping fails (the pool reopens on the next call).
+    """
+    while True:
+        await asyncio.sleep(_KEEPALIVE_INTERVAL)
+        if _conn.ps is not ps:
+            return
+        try:
+            async with _lock_for(connection_string):
+                await asyncio.to_thread(ps.query_device, "*OPC?")
+        except Exception:
+            return
+
+
+def _get_ps(connection_string: str) -> Any:
+    """
+    Get a warm DP832 session for the connection string, opening one if needed.
+
+    Args:
+        connection_string: VISA connection string
+
+    Returns:
+        Pooled DP832 instance
+    """
+    global _reaper_started
+
+    with _pool_lock:
+        entry = _pool.get(connection_string)
+        if entry is not None:
+            entry[1] = time.monotonic()
+            return entry[0]
+
+    try:
+        ps = DP832(conn_type="VISA", visa_resource_string=connection_string)
+    except Exception:
+        # A stale auto-discovered IP may be the culprit; force a re-scan
+        # on the next discovery attempt
+        _invalidate_discovery_cache()
+        raise
+
+    with _pool_lock:
+        _pool[connection_string] = [ps, time.monotonic()]
+        if not _reaper_started:
+            _reaper_started = True
+            threading.Thread(target=_reap_idle_sessions, daemon=True).start()
+    return ps
+
+
+def _drop_ps(connection_string: str):
+    """Close and forget the pooled session for the connection string"""
+    with _pool_lock:
+        entry = _pool.pop(connection_string, None)
+    if entry:
+        try:
+            entry[0].close()
+        except Exception:
+            pass
+
+
+# Last auto-discovered IP and when it was found; agents that call connect()
+# before every operation shouldn't trigger a fresh subnet sweep each time
+_discovery_cache: Optional[tuple] = None
+_DISCOVERY_CACHE_TTL = 30.0
+
+
+def _invalidate_discovery_cache():
+    """Forget the cached auto-discovery result (e.g. after a failed connect)"""
+    global _discovery_cache
+    _discovery_cache = None
+
+
 def auto_discover_device() -> Optional[str]:
     """
     Auto-discover a DP832 device on the network.
-    
+
+    Probes every local interface's subnet within a single timeout window,
+    so multi-homed hosts (VPN, secondary NIC) don't pay one sweep per
+    interface. A recent result (under 30 s old) is returned without
+    re-scanning.
+
     Returns:
         IP address of discovered device, or None if not found
     """
+    global _discovery_cache
+
+    if _discovery_cache and time.monotonic() - _discovery_cache[1] < _DISCOVERY_CACHE_TTL:
+        return _discovery_cache[0]
+
     try:
-        result = find_dp832()
-        if result:
-            ip, _ = result
+        hits = asyncio.run(_discover_network(DEFAULT_PORT))
+        if hits:
+            ip, _ = hits[0]
+            _discovery_cache = (ip, time.monotonic())
             return ip
         return None
     except Exception as e:
-        logger.error(f"Auto-discovery failed: {e}")
+        logger.error("Auto-discovery failed: %s", e)
         return None
 
 
 @mcp.tool()
-def ping() -> str:
+async def ping() -> str:
     """
     Simple health check to verify the MCP server is running.
 
@@ -86,14 +322,113 @@ def ping() -> str:
     return "pong"
 
 
+def _parse_idn(idn: str) -> Optional[Dict[str, str]]:
+    """
+    Parse a *IDN? reply into the device_info dict shape.
+
+    Args:
+        idn: Raw IDN string (manufacturer,model,serial,version)
+
+    Returns:
+        Device info dict, or None if the reply doesn't have four fields
+    """
+    fields = idn.split(",")
+    if len(fields) < 4:
+        return None
+    return {
+        "manufacturer": fields[0],
+        "model": fields[1],
+        "serial_number": fields[2],
+        "version": fields[3],
+    }
+
+
+async def _async_probe_idn(ip: str, port: int, sem: Optional[asyncio.Semaphore] = None,
+                           timeout: float = 1.0) -> Optional[tuple]:
+    """
+    Probe a single host for a Rigol DP-series IDN response.
+
+    Returns:
+        Tuple of (ip, idn_string) if a supported device answered, else None
+    """
+    if sem is None:
+        sem = asyncio.Semaphore(1)
+    async with sem:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, port), timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+        try:
+            writer.write(b"*IDN?\n")
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readline(), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+        idn = line.decode("ascii", "replace").strip()
+        idn_upper = idn.upper()
+        if "RIGOL" in idn_upper and any(m in idn_upper for m in ("DP832", "DP821", "DP712")):
+            return ip, idn
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _candidate_ips() -> tuple:
+    """
+    Candidate host IPs for discovery sweeps, built once and reused.
+
+    RIGOL_DP832_SUBNET (CIDR, e.g. "192.168.1.0/24") restricts the sweep to
+    a known subnet, skipping every other interface's range. Without it, the
+    local /24 bases are expanded to 254 addresses each. Either way the
+    expansion is pure allocation work that doesn't change between sweeps,
+    so cache the tuple. get_local_networks() itself caches the interface
+    lookup; call _candidate_ips.cache_clear() after changing networks.
+    """
+    subnet = os.environ.get("RIGOL_DP832_SUBNET")
+    if subnet:
+        network = ipaddress.ip_network(subnet, strict=False)
+        return tuple(str(host) for host in network.hosts())
+    return tuple(
+        f"{base}.{i}"
+        for base in get_local_networks()
+        for i in range(1, 255)
+    )
+
+
+async def _discover_network(port: int) -> List[tuple]:
+    """
+    Probe every host on the local /24 networks concurrently.
+
+    All probes run within a single timeout window, so a full sweep costs
+    roughly one probe timeout instead of one per host.
+
+    Returns:
+        List of (ip, idn_string) tuples for responding Rigol devices
+    """
+    sem = asyncio.Semaphore(64)
+    tasks = [_async_probe_idn(ip, port, sem) for ip in _candidate_ips()]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    return [r for r in results if isinstance(r, tuple)]
+
+
 @mcp.tool()
-def discover_devices() -> List[Dict[str, Any]]:
+async def discover_devices() -> List[Dict[str, Any]]:
     """
     Discover Rigol DP832/DP821/DP712 devices on the network.
 
     Scans the network for available Rigol power supplies and returns
     information about each discovered device including IP address,
-    connection string, and device details.
+    connection string, and device details. All hosts are probed
+    concurrently, so a full subnet sweep completes within roughly one
+    probe timeout.
 
     Returns:
         List[Dict[str, Any]]: List of discovered devices with connection information.
@@ -110,42 +445,27 @@ def discover_devices() -> List[Dict[str, Any]]:
         ]
     """
     try:
-        # The find_dp832 function returns (ip, device_id) or None
-        result = find_dp832()
-        
-        if result is None:
+        hits = await _discover_network(DEFAULT_PORT)
+
+        if not hits:
             return [{"error": "No DP832 devices found on the network"}]
-        
-        ip, device_id = result
-        connection_string = f"TCPIP0::{ip}::{DEFAULT_PORT}::SOCKET"
-        
-        try:
-            # Test connection and get device info
-            ps = DP832(conn_type="VISA", visa_resource_string=connection_string)
-            device_info = ps.id()
-            ps.close()
-            
-            return [{
-                "ip": ip,
-                "connection_string": connection_string,
-                "device_info": device_info
-            }]
-        except Exception as e:
-            logger.warning(f"Could not get device info for {ip}: {e}")
-            return [{
+
+        return [
+            {
                 "ip": ip,
-                "connection_string": connection_string,
-                "device_info": None,
-                "error": str(e)
-            }]
-        
+                "connection_string": f"TCPIP0::{ip}::{DEFAULT_PORT}::SOCKET",
+                "device_info": _parse_idn(idn)
+            }
+            for ip, idn in hits
+        ]
+
     except Exception as e:
-        logger.error(f"Device discovery failed: {e}")
+        logger.error("Device discovery failed: %s", e)
         return [{"error": str(e)}]
 
 
 @mcp.tool()
-def test_connection(ip_address: str = None) -> Dict[str, Any]:
+async def test_connection(ip_address: str = None) -> Dict[str, Any]:
     """
     Test connection to a Rigol power supply.
 
@@ -171,7 +491,7 @@ def test_connection(ip_address: str = None) -> Dict[str, Any]:
         if ip_address is None:
             if DEFAULT_IP is None:
                 # Try auto-discovery
-                ip_address = auto_discover_device()
+                ip_address = await asyncio.to_thread(auto_discover_device)
                 if ip_address is None:
                     return {
                         "status": "failed",
@@ -181,21 +501,18 @@ def test_connection(ip_address: str = None) -> Dict[str, Any]:
                 ip_address = DEFAULT_IP
         
         connection_string = f"TCPIP0::{ip_address}::{DEFAULT_PORT}::SOCKET"
-        
-        # Test the connection - test_ip returns device_id string or None
-        device_id = test_ip(ip_address)
-        
-        if device_id:
-            # Get device information
-            ps = DP832(conn_type="VISA", visa_resource_string=connection_string)
-            device_info = ps.id()
-            ps.close()
-            
+
+        # One socket, one *IDN? - the reply already contains everything the
+        # old test_ip-then-id() double round-trip fetched
+        hit = await _async_probe_idn(ip_address, DEFAULT_PORT)
+
+        if hit:
+            _, idn = hit
             return {
                 "status": "success",
                 "ip": ip_address,
                 "connection_string": connection_string,
-                "device_info": device_info
+                "device_info": _parse_idn(idn)
             }
         else:
             return {
@@ -212,7 +529,7 @@ def test_connection(ip_address: str = None) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def connect(ip_address: str = None, port: int = None) -> Dict[str, Any]:
+async def connect(ip_address: str = None, port: int = None) -> Dict[str, Any]:
     """
     Connect to a Rigol power supply.
 
@@ -235,18 +552,12 @@ def connect(ip_address: str = None, port: int = None) -> Dict[str, Any]:
             "device_info": {"manufacturer": "RIGOL TECHNOLOGIES", "model": "DP832", ...}
         }
     """
-    global current_ps
-    
     try:
-        # Close existing connection if any
-        if current_ps:
-            current_ps.close()
-        
         # Determine which IP to use
         if ip_address is None:
             if DEFAULT_IP is None:
                 # Try auto-discovery
-                ip_address = auto_discover_device()
+                ip_address = await asyncio.to_thread(auto_discover_device)
                 if ip_address is None:
                     return {
                         "status": "failed",
@@ -254,16 +565,52 @@ def connect(ip_address: str = None, port: int = None) -> Dict[str, Any]:
                     }
             else:
                 ip_address = DEFAULT_IP
-        
+
         # Get connection string
         connection_string = get_connection_string(ip_address, port)
-        
-        # Create new connection
-        current_ps = DP832(conn_type="VISA", visa_resource_string=connection_string)
-        
-        # Get device information
-        device_info = current_ps.id()
-        
+
+        # Point the default handle at a pooled session; any previous session
+        # stays warm in the pool until the idle reaper closes it
+        _conn.ps = await asyncio.to_thread(_get_ps, connection_string)
+        _conn.conn_str = connection_string
+
+        # Get device information. *IDN? never changes for a live session,
+        # so cache it for get_device_info. Since the transport opens
+        # lazily, this is also the first real I/O: if it fails the session
+        # is dead, so drop it from the pool, reset the handle (keeping the
+        # documented "No device connected" behavior for later tools), and
+        # force a re-scan in case a stale auto-discovered IP was used.
+        try:
+            device_info = await _call_ps(_conn.ps.id)
+        except Exception:
+            await asyncio.to_thread(_drop_ps, connection_string)
+            _conn.ps = None
+            _conn.conn_str = None
+            _invalidate_discovery_cache()
+            raise
+        _conn.id_info = device_info
+
+        # Keep the fresh session warm between tool calls
+        if _conn.keepalive is not None:
+            _conn.keepalive.cancel()
+        _conn.keepalive = asyncio.get_running_loop().create_task(
+            _keepalive(connection_string, _conn.ps)
+        )
+
+        # Remember which channels this model has so tools can validate
+        # channel arguments locally; reset first so an unrecognized model
+        # doesn't inherit the previous device's channel set
+        _conn.channels = None
+        _conn.bad_channel_error = None
+        model = device_info.get("model", "")
+        for name, channels in _VALID_CHANNELS.items():
+            if name in model:
+                _conn.channels = channels
+                _conn.bad_channel_error = (
+                    f"Invalid channel for {name}. Valid channels: {sorted(channels)}"
+                )
+                break
+
         return {
             "status": "connected",
             "ip": ip_address,
@@ -271,7 +618,7 @@ def connect(ip_address: str = None, port: int = None) -> Dict[str, Any]:
             "device_info": device_info
         }
     except Exception as e:
-        logger.error(f"Connection failed: {e}")
+        logger.error("Connection failed: %s", e)
         return {
             "status": "failed",
             "error": str(e)
@@ -279,7 +626,7 @@ def connect(ip_address: str = None, port: int = None) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def disconnect() -> str:
+async def disconnect() -> str:
     """
     Disconnect from the currently connected power supply.
 
@@ -288,12 +635,18 @@ def disconnect() -> str:
     Returns:
         str: Disconnection status message
     """
-    global current_ps
-    
-    if current_ps:
+    if _conn.ps:
         try:
-            current_ps.close()
-            current_ps = None
+            if _conn.keepalive is not None:
+                _conn.keepalive.cancel()
+                _conn.keepalive = None
+            if _conn.conn_str:
+                await asyncio.to_thread(_drop_ps, _conn.conn_str)
+            _conn.ps = None
+            _conn.conn_str = None
+            _conn.channels = None
+            _conn.bad_channel_error = None
+            _conn.id_info = None
             return "Disconnected successfully"
         except Exception as e:
             return f"Error during disconnect: {e}"
@@ -302,7 +655,7 @@ def disconnect() -> str:
 
 
 @mcp.tool()
-def get_device_info() -> Dict[str, Any]:
+async def get_device_info() -> Dict[str, Any]:
     """
     Get information about the currently connected device.
 
@@ -312,14 +665,129 @@ def get_device_info() -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    return current_ps.id()
+    ps = _conn.require()
+
+    # Serve the identity captured at connect() time; it can't change while
+    # the session is alive, so skip the *IDN? round-trip
+    if _conn.id_info is None:
+        _conn.id_info = await _call_ps(ps.id)
+    return _conn.id_info
+
+
+def _configure_channel(channel: int, voltage: Optional[float] = None,
+                       current: Optional[float] = None,
+                       ovp: Optional[float] = None, ocp: Optional[float] = None,
+                       ovp_enable: Optional[bool] = None,
+                       ocp_enable: Optional[bool] = None,
+                       output: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Apply the provided channel settings in a single compound SCPI write.
+
+    Only settings that were actually passed are included; the commands are
+    joined with ';' so the instrument receives one message regardless of how
+    many settings change.
+
+    Returns:
+        Dict of the settings that were applied
+    """
+    ps = _conn.require()
+    _check_channel(channel)
+    ps.channel_check(channel)
+
+    cmds = []
+    applied: Dict[str, Any] = {"channel": channel}
+
+    if voltage is not None and current is not None:
+        cmds.append(f":APPL CH{channel},{voltage},{current}")
+        applied["voltage"] = voltage
+        applied["current"] = current
+    elif voltage is not None:
+        cmds.append(f":SOUR{channel}:VOLT {voltage}")
+        applied["voltage"] = voltage
+    elif current is not None:
+        cmds.append(f":SOUR{channel}:CURR {current}")
+        applied["current"] = current
+
+    if ovp is not None:
+        cmds.append(f":OUTP:OVP:VAL CH{channel},{ovp}")
+        applied["ovp_value"] = ovp
+    if ovp_enable is not None:
+        cmds.append(f":OUTP:OVP CH{channel},{'ON' if ovp_enable else 'OFF'}")
+        applied["ovp_enabled"] = ovp_enable
+    if ocp is not None:
+        cmds.append(f":OUTP:OCP:VAL CH{channel},{ocp}")
+        applied["ocp_value"] = ocp
+    if ocp_enable is not None:
+        cmds.append(f":OUTP:OCP CH{channel},{'ON' if ocp_enable else 'OFF'}")
+        applied["ocp_enabled"] = ocp_enable
+    if output is not None:
+        cmds.append(f":OUTP:STAT CH{channel},{'ON' if output else 'OFF'}")
+        applied["output_enabled"] = output
+
+    if cmds:
+        ps.write_device(";".join(cmds))
+        # This write bypasses the DP setter methods, so drop the TTL-cached
+        # getter entries for everything it changed; otherwise reads within
+        # the cache window would return pre-write values
+        if voltage is not None or current is not None:
+            ps._invalidate_cache("get_channel_settings")
+        if ovp is not None:
+            ps._invalidate_cache("get_ovp_value")
+        if ovp_enable is not None:
+            ps._invalidate_cache("get_ovp_enabled")
+        if ocp is not None:
+            ps._invalidate_cache("get_ocp_value")
+        if ocp_enable is not None:
+            ps._invalidate_cache("get_ocp_enabled")
+        if output is not None:
+            ps._invalidate_cache("get_output_state")
+
+    return applied
+
+
+@mcp.tool()
+@_tool_result
+async def configure_channel(channel: int, voltage: float = None, current: float = None,
+                            ovp: float = None, ocp: float = None,
+                            ovp_enable: bool = None, ocp_enable: bool = None,
+                            output: bool = None) -> Dict[str, Any]:
+    """
+    Configure several channel settings in one instrument round-trip.
+
+    Provisioning a channel (voltage, current, protection limits, output
+    state) previously took one tool call and one SCPI round-trip per
+    setting; this tool batches every provided setting into a single
+    compound SCPI write.
+
+    Args:
+        channel (int): Channel number (1, 2, or 3 for DP832; 1, 2 for DP821; 1 for DP712)
+        voltage (float, optional): Voltage setting in volts
+        current (float, optional): Current setting in amperes
+        ovp (float, optional): Overvoltage protection limit in volts
+        ocp (float, optional): Overcurrent protection limit in amperes
+        ovp_enable (bool, optional): Enable/disable overvoltage protection
+        ocp_enable (bool, optional): Enable/disable overcurrent protection
+        output (bool, optional): Enable/disable the channel output
+
+    Returns:
+        Dict[str, Any]: Summary of all settings applied
+
+    Raises:
+        RuntimeError: If no device is currently connected
+    """
+    _conn.require()
+    _check_channel(channel)
+
+    return await _call_ps(
+        _configure_channel, channel, voltage=voltage, current=current,
+        ovp=ovp, ocp=ocp, ovp_enable=ovp_enable, ocp_enable=ocp_enable,
+        output=output,
+    )
 
 
 @mcp.tool()
-def set_channel_settings(channel: int, voltage: float, current: float) -> Dict[str, Any]:
+@_tool_result
+async def set_channel_settings(channel: int, voltage: float, current: float) -> Dict[str, Any]:
     """
     Set voltage and current settings for a specific channel.
 
@@ -334,26 +802,20 @@ def set_channel_settings(channel: int, voltage: float, current: float) -> Dict[s
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.set_channel_settings(channel, voltage, current)
-        return {
-            "status": "success",
-            "channel": channel,
-            "voltage": voltage,
-            "current": current
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(_configure_channel, channel, voltage=voltage, current=current)
+    return {
+        "channel": channel,
+        "voltage": voltage,
+        "current": current
+    }
 
 
 @mcp.tool()
-def get_channel_settings(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_channel_settings(channel: int) -> Dict[str, Any]:
     """
     Get current voltage and current settings for a specific channel.
 
@@ -366,25 +828,19 @@ def get_channel_settings(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        settings = current_ps.get_channel_settings(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "settings": settings
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    settings = await _call_ps(ps.get_channel_settings, channel)
+    return {
+        "channel": channel,
+        "settings": settings
+    }
 
 
 @mcp.tool()
-def set_output_state(channel: int, state: bool) -> Dict[str, Any]:
+@_tool_result
+async def set_output_state(channel: int, state: bool) -> Dict[str, Any]:
     """
     Enable or disable the output of a specific channel.
 
@@ -398,25 +854,19 @@ def set_output_state(channel: int, state: bool) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.set_output_state(channel, state)
-        return {
-            "status": "success",
-            "channel": channel,
-            "output_enabled": state
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(_configure_channel, channel, output=state)
+    return {
+        "channel": channel,
+        "output_enabled": state
+    }
 
 
 @mcp.tool()
-def get_output_state(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_output_state(channel: int) -> Dict[str, Any]:
     """
     Get the current output state of a specific channel.
 
@@ -429,25 +879,157 @@ def get_output_state(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        state = current_ps.get_output_state(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "output_enabled": state
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    state = await _call_ps(ps.get_output_state, channel)
+    return {
+        "channel": channel,
+        "output_enabled": state
+    }
+
+
+# Measurements are cached briefly so back-to-back calls (an agent asking for
+# voltage, then current, on the same channel) reuse one SCPI reply instead of
+# issuing a round-trip each
+# Constant part of measurement responses, shared by reference instead of
+# rebuilt as a fresh dict literal on every call in the polling hot path
+_MEAS_UNITS = {"voltage": "V", "current": "A", "power": "W"}
+
+_MEAS_CACHE_TTL = 0.05
+_meas_cache: Dict[int, tuple] = {}
+
+
+def _measure_channels(channels: List[int], use_cache: bool = True) -> Dict[int, Dict[str, float]]:
+    """
+    Measure voltage, current, and power for several channels in one SCPI query.
+
+    Channels with a fresh cache entry are served from the cache; the rest are
+    fetched with a single semicolon-compounded :MEAS:ALL? query, so N channels
+    cost one round-trip instead of N. Pass use_cache=False when every call
+    must reach the instrument (e.g. fixed-rate sampling).
+
+    Args:
+        channels: Channel numbers to measure
+        use_cache: Serve recent readings from the cache when fresh
+
+    Returns:
+        Dict mapping channel number to its measurements dict
+    """
+    now = time.monotonic()
+    results = {}
+    missing = []
+    for channel in channels:
+        cached = _meas_cache.get(channel) if use_cache else None
+        if cached and cached[0] > now:
+            results[channel] = cached[1]
+        else:
+            missing.append(channel)
+
+    if missing:
+        query = ";".join(f":MEAS:ALL? CH{c}" for c in missing)
+        raw = _conn.require().query_device(query).strip()
+        expiry = time.monotonic() + _MEAS_CACHE_TTL
+        for channel, part in zip(missing, raw.split(";")):
+            values = part.split(",")
+            measurements = {
+                "voltage": float(values[0]),
+                "current": float(values[1]),
+                "power": float(values[2]),
+            }
+            _meas_cache[channel] = (expiry, measurements)
+            results[channel] = measurements
+
+    return results
+
+
+@mcp.tool()
+@_tool_result
+async def measure_channels(channels: List[int]) -> Dict[str, Any]:
+    """
+    Measure voltage, current, and power for several channels at once.
+
+    Issues a single compound SCPI query for all requested channels, so
+    polling every channel costs one instrument round-trip instead of one
+    per channel.
+
+    Args:
+        channels (List[int]): Channel numbers to measure (e.g. [1, 2, 3])
+
+    Returns:
+        Dict[str, Any]: Measurements keyed by channel number
+
+    Raises:
+        RuntimeError: If no device is currently connected
+    """
+    _conn.require()
+    for c in channels:
+        _check_channel(c)
+
+    measurements = await _call_ps(_measure_channels, channels)
+    return {
+        "measurements": {str(c): m for c, m in measurements.items()},
+        "units": _MEAS_UNITS
+    }
+
+
+@mcp.tool()
+@_tool_result
+async def stream_measurements(channel: int, rate_hz: float = 10.0, count: int = 10) -> Dict[str, Any]:
+    """
+    Sample a channel repeatedly at a fixed rate and return all samples.
+
+    Collects `count` voltage/current/power samples over the persistent SCPI
+    session, pacing them at `rate_hz`. One tool call replaces a client-side
+    polling loop, so the per-sample cost is a single SCPI round-trip instead
+    of a full MCP request/response cycle.
+
+    Args:
+        channel (int): Channel number to sample
+        rate_hz (float): Sample rate in Hz (default 10.0)
+        count (int): Number of samples to collect (default 10)
+
+    Returns:
+        Dict[str, Any]: List of timestamped samples plus the parameters used
+
+    Raises:
+        RuntimeError: If no device is currently connected
+    """
+    _conn.require()
+    _check_channel(channel)
+
+    if rate_hz <= 0:
+        raise ValueError("rate_hz must be positive")
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    interval = 1.0 / rate_hz
+    samples = []
+    start = time.monotonic()
+    for i in range(count):
+        # Bypass the measurement cache: at rates above 1/TTL a cached
+        # reading would be replayed as if it were a new sample
+        measurement = (await _call_ps(_measure_channels, [channel], False))[channel]
+        samples.append({"t": round(time.monotonic() - start, 4), **measurement})
+        # Sleep to the next deadline rather than a fixed interval so SCPI
+        # round-trip time doesn't accumulate into rate drift
+        deadline = start + (i + 1) * interval
+        delay = deadline - time.monotonic()
+        if delay > 0 and i + 1 < count:
+            await asyncio.sleep(delay)
+
+    return {
+        "channel": channel,
+        "rate_hz": rate_hz,
+        "count": len(samples),
+        "samples": samples,
+        "units": _MEAS_UNITS
+    }
 
 
 @mcp.tool()
-def measure_voltage(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def measure_voltage(channel: int) -> Dict[str, Any]:
     """
     Measure the voltage of a specific channel.
 
@@ -460,26 +1042,20 @@ def measure_voltage(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        voltage = current_ps.measure_voltage(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "voltage": voltage,
-            "unit": "V"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    voltage = (await _call_ps(_measure_channels, [channel]))[channel]["voltage"]
+    return {
+        "channel": channel,
+        "voltage": voltage,
+        "unit": "V"
+    }
 
 
 @mcp.tool()
-def measure_current(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def measure_current(channel: int) -> Dict[str, Any]:
     """
     Measure the current of a specific channel.
 
@@ -492,26 +1068,20 @@ def measure_current(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current = current_ps.measure_current(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "current": current,
-            "unit": "A"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    current = (await _call_ps(_measure_channels, [channel]))[channel]["current"]
+    return {
+        "channel": channel,
+        "current": current,
+        "unit": "A"
+    }
 
 
 @mcp.tool()
-def measure_all(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def measure_all(channel: int) -> Dict[str, Any]:
     """
     Measure voltage, current, and power of a specific channel.
 
@@ -524,26 +1094,20 @@ def measure_all(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        measurements = current_ps.measure_all(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "measurements": measurements,
-            "units": {"voltage": "V", "current": "A", "power": "W"}
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    measurements = (await _call_ps(_measure_channels, [channel]))[channel]
+    return {
+        "channel": channel,
+        "measurements": measurements,
+        "units": _MEAS_UNITS
+    }
 
 
 @mcp.tool()
-def set_ocp_enabled(channel: int, state: bool) -> Dict[str, Any]:
+@_tool_result
+async def set_ocp_enabled(channel: int, state: bool) -> Dict[str, Any]:
     """
     Enable or disable overcurrent protection (OCP) for a specific channel.
 
@@ -557,25 +1121,19 @@ def set_ocp_enabled(channel: int, state: bool) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.set_ocp_enabled(channel, state)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ocp_enabled": state
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(_configure_channel, channel, ocp_enable=state)
+    return {
+        "channel": channel,
+        "ocp_enabled": state
+    }
 
 
 @mcp.tool()
-def get_ocp_enabled(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_ocp_enabled(channel: int) -> Dict[str, Any]:
     """
     Get the current overcurrent protection (OCP) state for a specific channel.
 
@@ -588,25 +1146,19 @@ def get_ocp_enabled(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        ocp_enabled = current_ps.get_ocp_enabled(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ocp_enabled": ocp_enabled
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    ocp_enabled = await _call_ps(ps.get_ocp_enabled, channel)
+    return {
+        "channel": channel,
+        "ocp_enabled": ocp_enabled
+    }
 
 
 @mcp.tool()
-def set_ocp_value(channel: int, current_limit: float) -> Dict[str, Any]:
+@_tool_result
+async def set_ocp_value(channel: int, current_limit: float) -> Dict[str, Any]:
     """
     Set the overcurrent protection (OCP) value for a specific channel.
 
@@ -620,26 +1172,20 @@ def set_ocp_value(channel: int, current_limit: float) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.set_ocp_value(channel, current_limit)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ocp_current_limit": current_limit,
-            "unit": "A"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(_configure_channel, channel, ocp=current_limit)
+    return {
+        "channel": channel,
+        "ocp_current_limit": current_limit,
+        "unit": "A"
+    }
 
 
 @mcp.tool()
-def get_ocp_value(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_ocp_value(channel: int) -> Dict[str, Any]:
     """
     Get the current overcurrent protection (OCP) value for a specific channel.
 
@@ -652,26 +1198,20 @@ def get_ocp_value(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        ocp_value = current_ps.get_ocp_value(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ocp_current_limit": ocp_value,
-            "unit": "A"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    ocp_value = await _call_ps(ps.get_ocp_value, channel)
+    return {
+        "channel": channel,
+        "ocp_current_limit": ocp_value,
+        "unit": "A"
+    }
 
 
 @mcp.tool()
-def set_ovp_enabled(channel: int, state: bool) -> Dict[str, Any]:
+@_tool_result
+async def set_ovp_enabled(channel: int, state: bool) -> Dict[str, Any]:
     """
     Enable or disable overvoltage protection (OVP) for a specific channel.
 
@@ -685,25 +1225,19 @@ def set_ovp_enabled(channel: int, state: bool) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.set_ovp_enabled(channel, state)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ovp_enabled": state
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(_configure_channel, channel, ovp_enable=state)
+    return {
+        "channel": channel,
+        "ovp_enabled": state
+    }
 
 
 @mcp.tool()
-def get_ovp_enabled(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_ovp_enabled(channel: int) -> Dict[str, Any]:
     """
     Get the current overvoltage protection (OVP) state for a specific channel.
 
@@ -716,25 +1250,19 @@ def get_ovp_enabled(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        ovp_enabled = current_ps.get_ovp_enabled(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ovp_enabled": ovp_enabled
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    ovp_enabled = await _call_ps(ps.get_ovp_enabled, channel)
+    return {
+        "channel": channel,
+        "ovp_enabled": ovp_enabled
+    }
 
 
 @mcp.tool()
-def set_ovp_value(channel: int, voltage_limit: float) -> Dict[str, Any]:
+@_tool_result
+async def set_ovp_value(channel: int, voltage_limit: float) -> Dict[str, Any]:
     """
     Set the overvoltage protection (OVP) value for a specific channel.
 
@@ -748,26 +1276,20 @@ def set_ovp_value(channel: int, voltage_limit: float) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.set_ovp_value(channel, voltage_limit)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ovp_voltage_limit": voltage_limit,
-            "unit": "V"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(_configure_channel, channel, ovp=voltage_limit)
+    return {
+        "channel": channel,
+        "ovp_voltage_limit": voltage_limit,
+        "unit": "V"
+    }
 
 
 @mcp.tool()
-def get_ovp_value(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_ovp_value(channel: int) -> Dict[str, Any]:
     """
     Get the current overvoltage protection (OVP) value for a specific channel.
 
@@ -780,26 +1302,20 @@ def get_ovp_value(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        ovp_value = current_ps.get_ovp_value(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ovp_voltage_limit": ovp_value,
-            "unit": "V"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    ovp_value = await _call_ps(ps.get_ovp_value, channel)
+    return {
+        "channel": channel,
+        "ovp_voltage_limit": ovp_value,
+        "unit": "V"
+    }
 
 
 @mcp.tool()
-def get_output_mode(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_output_mode(channel: int) -> Dict[str, Any]:
     """
     Get the current output mode of a specific channel.
 
@@ -814,25 +1330,19 @@ def get_output_mode(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        mode = current_ps.get_output_mode(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "output_mode": mode
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    mode = await _call_ps(ps.get_output_mode, channel)
+    return {
+        "channel": channel,
+        "output_mode": mode
+    }
 
 
 @mcp.tool()
-def clear_ocp_alarm(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def clear_ocp_alarm(channel: int) -> Dict[str, Any]:
     """
     Clear the overcurrent protection (OCP) alarm for a specific channel.
 
@@ -845,25 +1355,19 @@ def clear_ocp_alarm(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.clear_ocp_alarm(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "message": "OCP alarm cleared"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(ps.clear_ocp_alarm, channel)
+    return {
+        "channel": channel,
+        "message": "OCP alarm cleared"
+    }
 
 
 @mcp.tool()
-def clear_ovp_alarm(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def clear_ovp_alarm(channel: int) -> Dict[str, Any]:
     """
     Clear the overvoltage protection (OVP) alarm for a specific channel.
 
@@ -876,25 +1380,19 @@ def clear_ovp_alarm(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        current_ps.clear_ovp_alarm(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "message": "OVP alarm cleared"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    await _call_ps(ps.clear_ovp_alarm, channel)
+    return {
+        "channel": channel,
+        "message": "OVP alarm cleared"
+    }
 
 
 @mcp.tool()
-def get_ocp_alarm(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_ocp_alarm(channel: int) -> Dict[str, Any]:
     """
     Check if overcurrent protection (OCP) alarm is active for a specific channel.
 
@@ -907,25 +1405,19 @@ def get_ocp_alarm(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        alarm_active = current_ps.get_ocp_alarm(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ocp_alarm_active": alarm_active
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    alarm_active = await _call_ps(ps.get_ocp_alarm, channel)
+    return {
+        "channel": channel,
+        "ocp_alarm_active": alarm_active
+    }
 
 
 @mcp.tool()
-def get_ovp_alarm(channel: int) -> Dict[str, Any]:
+@_tool_result
+async def get_ovp_alarm(channel: int) -> Dict[str, Any]:
     """
     Check if overvoltage protection (OVP) alarm is active for a specific channel.
 
@@ -938,25 +1430,21 @@ def get_ovp_alarm(channel: int) -> Dict[str, Any]:
     Raises:
         RuntimeError: If no device is currently connected
     """
-    if not current_ps:
-        raise RuntimeError("No device connected. Use connect() first.")
-    
-    try:
-        alarm_active = current_ps.get_ovp_alarm(channel)
-        return {
-            "status": "success",
-            "channel": channel,
-            "ovp_alarm_active": alarm_active
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+    ps = _conn.require()
+    _check_channel(channel)
+
+    alarm_active = await _call_ps(ps.get_ovp_alarm, channel)
+    return {
+        "channel": channel,
+        "ovp_alarm_active": alarm_active
+    }
 
 
 def main():
     """Entry point for the MCP server."""
+    # Running as an application, so configure real log output here; library
+    # importers get the NullHandler installed at module level instead.
+    logging.basicConfig(level=logging.INFO)
     mcp.run()
 
 
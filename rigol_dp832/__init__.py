@@ -0,0 +1,4 @@
+import logging
+
+# Library code should be silent unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
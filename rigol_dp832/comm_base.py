@@ -1,13 +1,80 @@
+import functools
 import logging
+import socket
+import time
 import pyvisa
 from typing import Literal
 
-# Set up basic logging config
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    force=True,
-)
+# Library modules must not configure the root logger; the package installs
+# a NullHandler and applications attach their own handlers. Messages use
+# deferred %s formatting so disabled levels cost only the level check.
+log = logging.getLogger(__name__)
+
+
+def _ttl_cache(seconds=0.5):
+    """
+    Memoize a read-only query method on the instance for a short time.
+
+    Entries live in self._query_cache keyed by (method name, arguments), so
+    dashboards polling the same getters every tick pay one SCPI round-trip
+    per TTL window instead of one per call. seconds=None caches forever
+    (for values that can't change, like *IDN?). Decorated methods accept
+    use_cache=False to force a fresh query; setters should call
+    _invalidate_cache to drop stale entries immediately.
+    """
+
+    def decorator(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, use_cache=True, **kwargs):
+            cache = getattr(self, "_query_cache", None)
+            if cache is None:
+                cache = self._query_cache = {}
+            key = (name,) + args + tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            if use_cache:
+                hit = cache.get(key)
+                if hit is not None and (hit[1] is None or now < hit[1]):
+                    return hit[0]
+            value = fn(self, *args, **kwargs)
+            cache[key] = (value, None if seconds is None else now + seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+class _SocketInst:
+    """
+    Minimal raw-socket SCPI transport with a pyvisa-like interface.
+
+    Speaks LF-terminated SCPI directly over TCP and skips the VISA stack
+    entirely; for the short queries this library issues, the VISA layer's
+    per-call overhead dwarfs the payload. Exposes query/write/close so
+    CommBase can drive either transport interchangeably.
+    """
+
+    def __init__(self, host: str, port: int = 5555, timeout: float = 2.0):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        # Small commands must not sit in Nagle's buffer waiting for an ACK
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Buffered reader so a reply line costs one recv in the common case
+        self._rfile = self.sock.makefile("rb")
+
+    def write(self, command: str):
+        self.sock.sendall(command.encode("ascii") + b"\n")
+
+    def query(self, command: str) -> str:
+        self.write(command)
+        return self._rfile.readline().decode("ascii").rstrip("\n")
+
+    def close(self):
+        try:
+            self._rfile.close()
+        finally:
+            self.sock.close()
 
 
 class CommBase:
@@ -32,29 +99,89 @@ class CommBase:
         # Check for connection type and set up device accordingly
         self.visa_resource_string = visa_resource_string
         self.conn_type = conn_type
-        
-        if conn_type == "VISA":
-            self.configure_visa(visa_resource_string)
-        elif conn_type == "Socket":
-            pass
-        else:
+        # Initialize the handles first so close() is safe to call even if
+        # connection setup fails partway through
+        self.rm = None
+        self._inst = None
+
+        if conn_type not in ("VISA", "Socket"):
             # Runtime check to enforce the allowed values
             raise ValueError(
                 f"Invalid connection type: {conn_type}. Valid types are {self.ConnType.__args__}"
             )
+        # The connection itself is opened lazily by the `inst` property on
+        # first use, so constructing an instance costs no network I/O.
+
+    @property
+    def inst(self):
+        """The underlying instrument session, opened on first access"""
+        if self._inst is None:
+            try:
+                if self.conn_type == "VISA":
+                    self.configure_visa(self.visa_resource_string)
+                else:
+                    self.configure_socket(self.visa_resource_string)
+            except Exception:
+                # Release whatever was acquired before the failure
+                self.close()
+                raise
+        return self._inst
+
+    @inst.setter
+    def inst(self, value):
+        self._inst = value
 
     def configure_visa(self, visa_resource_string: str = None):
         self.rm = pyvisa.ResourceManager()
         
         # If a specific VISA resource string is provided, use it directly
         if visa_resource_string:
-            logging.info(f"Using provided VISA resource: {visa_resource_string}")
-            self.inst = self.rm.open_resource(visa_resource_string, read_termination="\n")
+            log.info("Using provided VISA resource: %s", visa_resource_string)
+            self.inst = self.rm.open_resource(
+                visa_resource_string,
+                read_termination="\n",
+                write_termination="\n",
+            )
+            # pyvisa splits each read into many small low-level calls by
+            # default; a large chunk size lets any reply arrive in a single
+            # recv.
+            self.inst.chunk_size = 102400
+            # pyvisa-py's TCPIP SOCKET session exposes the raw socket;
+            # disable Nagle there so each small SCPI write leaves
+            # immediately instead of waiting out a delayed ACK. Other
+            # backends don't expose the socket, hence the broad guard.
+            try:
+                interface = self.inst.visalib.sessions[self.inst.session].interface
+                interface.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (AttributeError, KeyError, OSError):
+                pass
             return
         
         # If no resource string provided, raise an error
         raise ValueError("VISA resource string is required for VISA connection type")
 
+    def configure_socket(self, visa_resource_string: str = None):
+        """
+        Open a raw TCP socket to the instrument, bypassing VISA.
+
+        Accepts the same TCPIP0::<host>::<port>::SOCKET resource string as
+        the VISA path, so switching transports doesn't require a different
+        connection string.
+        """
+        if not visa_resource_string:
+            raise ValueError("VISA resource string is required for Socket connection type")
+
+        parts = visa_resource_string.split("::")
+        if len(parts) < 2:
+            raise ValueError(
+                f"Cannot parse host from resource string: {visa_resource_string}"
+            )
+        host = parts[1]
+        port = int(parts[2]) if len(parts) > 3 else 5555
+
+        log.info("Opening raw socket connection to %s:%d", host, port)
+        self.inst = _SocketInst(host, port)
+
     def query_device(self, command: str) -> str:
         """
         Wrapper function to query the device.
@@ -83,22 +210,47 @@ class CommBase:
 
     def close(self):
         """
-        Close the opened device and any associated resources
+        Close the opened device session
+
+        Safe to call at any point, including after a failed __init__: the
+        session is released only if it was actually opened, and released
+        once. The ResourceManager is deliberately left open — pyvisa hands
+        out a shared, cached manager per library, and closing it terminates
+        every session obtained from it, including other instruments';
+        pyvisa closes it itself at interpreter exit.
         """
-        self.inst.close()
-        if self.conn_type == "VISA":
-            self.rm.close()
+        if self._inst is not None:
+            self._inst.close()
+            self._inst = None
+        self.rm = None
+
+    def _invalidate_cache(self, method: str):
+        """
+        Drop all cached replies recorded for the given getter name
 
+        :param method: Name of the _ttl_cache-decorated method to invalidate
+        :type method: str
+        """
+        cache = getattr(self, "_query_cache", None)
+        if not cache:
+            return
+        for key in [k for k in cache if k[0] == method]:
+            del cache[key]
+
+    @_ttl_cache(seconds=None)
     def id(self) -> dict:
         """
         Query the ID string of the instrument
 
+        The reply can never change for a live session, so it is cached
+        forever after the first query.
+
         :return: Dictionary containing the manufacturer, instrument model,
                  serial number, and version number.
         :rtype: dict
         """
         id_str = self.query_device("*IDN?").strip().split(",")
-        logging.debug(f"id_str: {id_str}")
+        log.debug("id_str: %s", id_str)
         return {
             "manufacturer": id_str[0],
             "model": id_str[1],
@@ -109,12 +261,16 @@ class CommBase:
 
 if __name__ == "__main__":
     # Example usage with VISA Ethernet connection
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     try:
         test_inst = CommBase(
             conn_type="VISA", 
             visa_resource_string="TCPIP0::192.168.1.100::5555::SOCKET"
         )
-        logging.info(test_inst.id())
+        log.info(test_inst.id())
         test_inst.close()
     except Exception as e:
-        logging.error(f"VISA Ethernet connection failed: {e}")
+        log.error("VISA Ethernet connection failed: %s", e)
@@ -5,24 +5,62 @@ Simple DP832 Network Discovery
 This script will automatically find your Rigol DP832 on the network.
 """
 
+import argparse
+import asyncio
+import atexit
+import functools
+import json
+import logging
 import sys
 import os
+import re
 import socket
-import subprocess
+import struct
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 # Add current directory for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# pyvisa is only needed for the shared ResourceManager; the discovery probes
+# themselves use raw sockets. Import it once at module level so probe calls
+# don't re-enter the import machinery (and its lock) per invocation.
 try:
     import pyvisa
-    from rigol_dp832.rigol_dp import DP832
-    VISA_AVAILABLE = True
 except ImportError:
-    VISA_AVAILABLE = False
-    print("Error: PyVISA not available. Please install: pip install pyvisa")
-    sys.exit(1)
+    pyvisa = None
 
+# Per-IP progress goes through the logging module at DEBUG so library users
+# pay nothing for it by default (the package installs a NullHandler); the CLI
+# opts in with --verbose. Logging handlers also serialize output for us, so
+# no extra queue/lock machinery is needed in the scan workers.
+log = logging.getLogger(__name__)
+
+# Matches a DP832 *IDN? reply directly on the raw bytes; one C-level scan
+# instead of uppercasing the payload and substring-searching it twice.
+_DP832_RE = re.compile(rb"RIGOL.*DP832", re.IGNORECASE)
+
+
+# Shared pyvisa ResourceManager. Constructing one triggers backend/plugin
+# discovery, so build it lazily once and reuse it across all probes.
+_RM = None
+_RM_LOCK = threading.Lock()
+
+
+def _get_rm():
+    """Return the shared pyvisa ResourceManager, creating it on first use"""
+    global _RM
+    if pyvisa is None:
+        raise ImportError("PyVISA not available. Please install: pip install pyvisa")
+    with _RM_LOCK:
+        if _RM is None:
+            _RM = pyvisa.ResourceManager()
+            atexit.register(_RM.close)
+        return _RM
+
+
+@functools.lru_cache(maxsize=1)
 def get_local_network():
     """Get the local network range"""
     try:
@@ -34,95 +72,227 @@ def get_local_network():
     except:
         return "192.168.1"  # Default fallback
 
-def ping_ip(ip):
-    """Ping a single IP address"""
+
+def get_local_networks():
+    """
+    Get the /24 network bases of every local IPv4 interface.
+
+    Multi-homed hosts (VPN, secondary NIC, WSL) may have the DP832 on an
+    interface other than the default route, so collect them all. The
+    default-route base always comes first.
+    """
+    bases = [get_local_network()]
     try:
-        result = subprocess.run(
-            ["ping", "-c", "1", "-W", "1", ip],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        return result.returncode == 0
-    except:
-        return False
+        for info in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+            ip = info[4][0]
+            # Skip loopback and link-local addresses
+            if ip.startswith("127.") or ip.startswith("169.254."):
+                continue
+            base = ".".join(ip.split(".")[:-1])
+            if base not in bases:
+                bases.append(base)
+    except OSError:
+        pass
+    return bases
+
+
+def invalidate_network_cache():
+    """Forget the cached local network bases (e.g. after changing networks)"""
+    get_local_network.cache_clear()
+
+def _set_probe_sockopts(s):
+    """Apply the standard probe socket options.
 
-def test_dp832_connection(ip):
+    SO_REUSEADDR keeps repeated scans from exhausting local ports on
+    TIME_WAIT sockets, TCP_NODELAY stops Nagle from delaying the tiny
+    *IDN? payload, and a zero-second SO_LINGER makes close() send an
+    immediate RST instead of a FIN handshake, so probe sockets never
+    accumulate in TIME_WAIT during a sweep.
+    """
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+
+
+def test_dp832_connection(ip, port=5555):
     """Test if IP has a DP832"""
+    # Talk SCPI over a raw socket rather than pyvisa: the probe only needs
+    # to send *IDN? and read one line, and skipping VISA session setup cuts
+    # per-IP probe latency to roughly one round-trip.
     try:
-        resource_string = f"TCPIP0::{ip}::5555::SOCKET"
-        rm = pyvisa.ResourceManager()
-        inst = rm.open_resource(resource_string, read_termination="\n", timeout=2000)
-        
-        # Try to get device ID
-        id_response = inst.query("*IDN?")
-        inst.close()
-        rm.close()
-        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(0.5)
+            _set_probe_sockopts(s)
+            # Where supported (Linux), TCP Fast Open lets the *IDN? payload
+            # ride along with the connection handshake, saving one RTT.
+            if hasattr(socket, "TCP_FASTOPEN_CONNECT"):
+                try:
+                    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_FASTOPEN_CONNECT, 1)
+                except OSError:
+                    pass
+            s.connect((ip, port))
+            s.sendall(b"*IDN?\n")
+            buf = b""
+            while b"\n" not in buf:
+                chunk = s.recv(256)
+                if not chunk:
+                    break
+                buf += chunk
+
         # Check if it's a Rigol DP832
-        if "RIGOL" in id_response.upper() and "DP832" in id_response.upper():
-            return id_response.strip()
+        if _DP832_RE.search(buf):
+            return buf.decode("ascii", "replace").strip()
         return False
-    except:
+    except OSError:
         return False
 
-def find_dp832():
-    """Find DP832 on the network"""
-    print("🔍 Searching for Rigol DP832 on the network...")
-    print("This may take a minute...")
-    
-    # Get local network
-    network_base = get_local_network()
-    print(f"Scanning network: {network_base}.x")
-    
-    # First, find responsive hosts
-    print("\nStep 1: Finding responsive hosts...")
-    responsive_ips = []
-    
-    with ThreadPoolExecutor(max_workers=50) as executor:
-        futures = {}
-        for i in range(1, 255):
-            ip = f"{network_base}.{i}"
-            futures[executor.submit(ping_ip, ip)] = ip
-        
-        for future in as_completed(futures):
-            ip = futures[future]
-            if future.result():
-                responsive_ips.append(ip)
-                print(f"  ✓ {ip}")
-    
-    if not responsive_ips:
-        print("❌ No responsive hosts found. Check your network connection.")
+def _cache_path():
+    """Path of the JSON file remembering the last discovered device"""
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "rigol_dp832" / "last.json"
+
+
+def _read_cached_device():
+    """Return the cached (ip, device_id) tuple, or None if there isn't one"""
+    try:
+        with open(_cache_path()) as f:
+            data = json.load(f)
+        return data["ip"], data["device_id"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_cached_device(ip, device_id):
+    """Remember a discovered device so the next run can skip the sweep"""
+    path = _cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"ip": ip, "device_id": device_id}))
+    except OSError:
+        pass
+
+
+async def _async_probe_idn(ip, port=5555, connect_timeout=0.3, read_timeout=1.0):
+    """
+    Connect and read the *IDN? reply over asyncio.
+
+    Does the whole probe — connect, query, match — on the one connection,
+    so a candidate costs a single socket instead of a connect-scan socket
+    plus a separate probe socket.
+
+    :return: (ip, device_id) if a DP832 answered, otherwise None
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, port), connect_timeout
+        )
+    except (OSError, asyncio.TimeoutError):
         return None
-    
-    print(f"\nFound {len(responsive_ips)} responsive hosts")
-    
-    # Second, test each for DP832
-    print("\nStep 2: Testing for DP832 devices...")
-    
-    for ip in responsive_ips:
-        print(f"  Testing {ip}...", end=" ")
-        device_id = test_dp832_connection(ip)
-        if device_id:
-            print(f"🎉 FOUND DP832!")
-            print(f"\nDevice Information:")
-            print(f"  IP Address: {ip}")
-            print(f"  Device ID: {device_id}")
-            print(f"  VISA Resource: TCPIP0::{ip}::5555::SOCKET")
-            return ip, device_id
-        else:
-            print("✗")
-    
-    print("\n❌ No DP832 found on the network.")
+
+    log.debug("responsive %s", ip)
+    try:
+        writer.write(b"*IDN?\n")
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), read_timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    if _DP832_RE.search(line):
+        return ip, line.decode("ascii", "replace").strip()
+    log.debug("no DP832 at %s", ip)
     return None
 
-def main():
-    """Main function"""
-    print("Rigol DP832 Network Discovery")
-    print("=" * 40)
-    
-    result = find_dp832()
-    
+
+async def _scan_base_async(network_base, port=5555):
+    """Probe every host on a /24 base concurrently, returning the first hit"""
+    tasks = [
+        asyncio.ensure_future(_async_probe_idn(f"{network_base}.{i}", port))
+        for i in range(1, 255)
+    ]
+    try:
+        for task in asyncio.as_completed(tasks):
+            hit = await task
+            if hit:
+                return hit
+    finally:
+        # First hit wins; asyncio.run reaps the cancelled stragglers
+        for task in tasks:
+            task.cancel()
+    return None
+
+
+def _scan_base(network_base):
+    """Scan a single /24 base for a DP832, returning (ip, device_id) or None"""
+    # Every host is probed concurrently on one event loop, and each probe
+    # sends *IDN? on the same connection its port check opened — one socket
+    # and roughly one timeout window for the whole /24, with no thread
+    # pools and no subprocess forks.
+    log.info("Scanning %s.x for a DP832 on port %d...", network_base, 5555)
+
+    result = asyncio.run(_scan_base_async(network_base))
+    if result:
+        log.info("Found DP832 at %s (%s)", *result)
+    return result
+
+
+def find_dp832(use_cache=True):
+    """Find DP832 on the network"""
+    # Devices rarely move between runs, so try the last known IP before
+    # paying for a full sweep.
+    if use_cache:
+        cached = _read_cached_device()
+        if cached:
+            cached_ip, _ = cached
+            device_id = test_dp832_connection(cached_ip)
+            if device_id:
+                log.info("Found cached DP832 at %s", cached_ip)
+                return cached_ip, device_id
+
+    # Scan every local interface's /24 at the same time; a multi-homed host
+    # may have the DP832 on a non-default interface.
+    network_bases = get_local_networks()
+    log.info("Searching networks: %s", ", ".join(f"{b}.x" for b in network_bases))
+
+    if len(network_bases) == 1:
+        result = _scan_base(network_bases[0])
+    else:
+        result = None
+        with ThreadPoolExecutor(max_workers=len(network_bases)) as executor:
+            futures = [executor.submit(_scan_base, base) for base in network_bases]
+            for future in as_completed(futures):
+                hit = future.result()
+                if hit and result is None:
+                    result = hit
+
+    if result:
+        _write_cached_device(*result)
+        return result
+
+    log.info("No DP832 found on the network")
+    return None
+
+def _discover(args):
+    """Run discovery for the scope selected on the command line"""
+    if args.ip:
+        device_id = test_dp832_connection(args.ip)
+        return (args.ip, device_id) if device_id else None
+
+    if args.network:
+        result = _scan_base(args.network)
+        if result:
+            _write_cached_device(*result)
+        return result
+
+    return find_dp832(use_cache=not args.no_cache)
+
+
+def _report(result):
+    """Print the success code sample or troubleshooting hints"""
     if result:
         ip, device_id = result
         print(f"\n✅ SUCCESS! Your DP832 is at: {ip}")
@@ -139,5 +309,42 @@ def main():
         print(f"3. Verify the device has a valid IP address")
         print(f"4. Try running: ping {get_local_network()}.1")
 
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Rigol DP832 Network Discovery")
+    parser.add_argument(
+        "--ip",
+        help="Probe a specific IP address instead of sweeping the network",
+    )
+    parser.add_argument(
+        "--network",
+        metavar="BASE",
+        help="Sweep a specific /24 base (e.g. 192.168.1) instead of auto-detecting",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the cached device IP and always run a full sweep",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Show per-IP scan progress",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+    )
+
+    print("Rigol DP832 Network Discovery")
+    print("=" * 40)
+
+    _report(_discover(args))
+
+
 if __name__ == "__main__":
     main()
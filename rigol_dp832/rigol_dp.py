@@ -10,7 +10,22 @@ Adapted from: https://fixturfab.com/articles/controlling-rigol-dp832-using-pyvis
 """
 
 import logging
-from .comm_base import CommBase
+import time
+from .comm_base import CommBase, _ttl_cache
+
+log = logging.getLogger(__name__)
+
+# How long a :MEAS:ALL? reply stays fresh. Long enough that reading
+# voltage, current, and power back-to-back costs one query instead of
+# three, short enough that polling loops still see live values.
+_MEAS_CACHE_TTL = 0.05
+
+# Pre-built SCPI query strings keyed by channel. These are the commands the
+# polling hot paths issue over and over; building them once skips the
+# per-call f-string interpolation.
+_MEAS_ALL_Q = {c: f":MEAS:ALL? CH{c}" for c in (1, 2, 3)}
+_OUTP_STAT_Q = {c: f":OUTP:STAT? CH{c}" for c in (1, 2, 3)}
+_APPL_Q = {c: f":APPL? CH{c}" for c in (1, 2, 3)}
 
 
 class DP(CommBase):
@@ -24,13 +39,89 @@ class DP(CommBase):
     supported by the power supply.
     """
 
+    # Output channels the model provides; overridden by each subclass
+    CHANNELS = ()
+    # Channel set used for validation; "" selects the instrument's current
+    # channel and is always accepted
+    _VALID = frozenset()
+
     def channel_check(self, channel):
         """
-        Implemented by each power supply model to verify that the channel
-        specified actually exists for the given model
+        Verify that the specified channel exists for the given model
+
+        Membership is tested against a frozenset precomputed per subclass,
+        instead of the list literal each model used to rebuild on every
+        SCPI operation.
+        """
+        assert channel == "" or channel in self._VALID, (
+            f"Output channel {channel} not supported"
+        )
+
+    def query_batch(self, commands):
+        """
+        Send several SCPI queries as one compound message and split the reply
+
+        SCPI allows queries to be joined with ';'; the instrument answers
+        with the replies ';'-separated in the same order. This turns N
+        write/read round-trips into one, which dominates the cost of each
+        query on a LAN connection.
+
+        :param commands: SCPI query strings to send
+        :type commands: list
+        :return: One reply string per command, in order
+        :rtype: list
+        """
+        reply = self.query_device(";".join(commands))
+        return [part.strip() for part in reply.split(";")]
+
+    def get_all_output_states(self) -> dict:
+        """
+        Query the output state of every channel in a single round-trip
+
+        :return: Dictionary mapping channel number to enabled state
+        :rtype: dict
+        """
+        states = self.query_batch([_OUTP_STAT_Q[c] for c in self.CHANNELS])
+        return {c: s == "ON" for c, s in zip(self.CHANNELS, states)}
+
+    def get_all_settings(self) -> dict:
+        """
+        Query the voltage and current settings of every channel in a single
+        round-trip
+
+        :return: Dictionary mapping channel number to its settings dict
+        :rtype: dict
+        """
+        replies = self.query_batch([_APPL_Q[c] for c in self.CHANNELS])
+        settings = {}
+        for channel, reply in zip(self.CHANNELS, replies):
+            parts = reply.split(",")
+            settings[channel] = {
+                "voltage": float(parts[-2]),
+                "current": float(parts[-1]),
+            }
+        return settings
+
+    def get_all_measurements(self) -> dict:
         """
-        assert NotImplementedError
+        Measure voltage, current, and power on every channel in a single
+        round-trip
 
+        :return: Dictionary mapping channel number to its measurements dict
+        :rtype: dict
+        """
+        replies = self.query_batch([_MEAS_ALL_Q[c] for c in self.CHANNELS])
+        measurements = {}
+        for channel, reply in zip(self.CHANNELS, replies):
+            parts = reply.split(",")
+            measurements[channel] = {
+                "voltage": float(parts[0]),
+                "current": float(parts[1]),
+                "power": float(parts[2]),
+            }
+        return measurements
+
+    @_ttl_cache(seconds=0.5)
     def get_output_mode(self, channel: int) -> str:
         """
         Query the current output mode of the specified channel
@@ -126,7 +217,9 @@ class DP(CommBase):
             state = "OFF"
 
         self.inst.write(f":OUTP:OCP CH{channel},{state}")
+        self._invalidate_cache("get_ocp_enabled")
 
+    @_ttl_cache(seconds=0.5)
     def get_ocp_enabled(self, channel: int = "") -> bool:
         """
         Query the status of overcurrent protection (OCP) of the specified
@@ -146,7 +239,7 @@ class DP(CommBase):
             channel = f" CH{channel}"
 
         state = self.query_device(f":OUTP:OCP?{channel}").strip()
-        logging.debug(f"state: {state}")
+        log.debug("state: %s", state)
         return state == "ON"
 
     def set_ocp_value(self, channel: int, setting: float):
@@ -163,7 +256,9 @@ class DP(CommBase):
         """
         self.channel_check(channel)
         self.inst.write(f":OUTP:OCP:VAL CH{channel},{setting}")
+        self._invalidate_cache("get_ocp_value")
 
+    @_ttl_cache(seconds=0.5)
     def get_ocp_value(self, channel: int) -> float:
         """
         Query the OCP value of the specified channel.
@@ -248,7 +343,9 @@ class DP(CommBase):
             state = "OFF"
 
         self.inst.write(f":OUTP:OVP CH{channel},{state}")
+        self._invalidate_cache("get_ovp_enabled")
 
+    @_ttl_cache(seconds=0.5)
     def get_ovp_enabled(self, channel: int = "") -> bool:
         """
         Query the status of OVP on the specified channel
@@ -264,7 +361,7 @@ class DP(CommBase):
             channel = f" CH{channel}"
 
         state = self.query_device(f":OUTP:OVP?{channel}").strip()
-        logging.debug(f"state: {state}")
+        log.debug("state: %s", state)
         return state == "ON"
 
     def set_ovp_value(self, channel: int, setting: float):
@@ -282,7 +379,9 @@ class DP(CommBase):
         self.channel_check(channel)
 
         self.inst.write(f":OUTP:OVP:VAL CH{channel},{setting}")
+        self._invalidate_cache("get_ovp_value")
 
+    @_ttl_cache(seconds=0.5)
     def get_ovp_value(self, channel: int) -> float:
         """
         Query the OVP value of the specified channel.
@@ -319,7 +418,9 @@ class DP(CommBase):
             state = "OFF"
 
         self.inst.write(f":OUTP:STAT CH{channel},{state}")
+        self._invalidate_cache("get_output_state")
 
+    @_ttl_cache(seconds=0.5)
     def get_output_state(self, channel: int = "") -> bool:
         """
         Query the output status of the specified channel
@@ -350,7 +451,32 @@ class DP(CommBase):
         """
         self.channel_check(channel)
         self.inst.write(f":APPL CH{channel},{voltage},{current}")
+        self._invalidate_cache("get_channel_settings")
 
+    def set_channel_settings_many(self, points):
+        """
+        Set voltage and current on several channels in a single write
+
+        The :APPL commands are joined with ';' into one compound SCPI
+        message, so a multi-channel update (or one point of a ramp across
+        channels) costs one TCP write instead of one per channel.
+
+        :param points: Iterable of (channel, voltage, current) tuples
+        :type points: list
+        """
+        points = list(points)
+        for channel, _, _ in points:
+            self.channel_check(channel)
+
+        if not points:
+            return
+
+        self.inst.write(
+            ";".join(f":APPL CH{c},{v},{i}" for c, v, i in points)
+        )
+        self._invalidate_cache("get_channel_settings")
+
+    @_ttl_cache(seconds=0.5)
     def get_channel_settings(self, channel: int = "") -> dict:
         """
         Query the specified channels current settings
@@ -373,46 +499,80 @@ class DP(CommBase):
         """
         Get the current measurement for the given channel
 
+        Delegates to measure_all, so reading several quantities in quick
+        succession costs a single :MEAS:ALL? query.
+
         :param channel: Channel to read current measurement from
         :type channel: int
         :return: Current measurement in A
         :rtype: float
         """
-        self.channel_check(channel)
-
-        meas = self.query_device(f":MEAS:CURR? CH{channel}").strip()
-        return float(meas)
+        return self.measure_all(channel)["current"]
 
     def measure_voltage(self, channel):
         """
         Ger the voltage measurement for the given channel
 
+        Delegates to measure_all, so reading several quantities in quick
+        succession costs a single :MEAS:ALL? query.
+
         :param channel: Channel to read voltage measurement from
         :type channel: int
-        :return: Current measurement in A
+        :return: Voltage measurement in V
         :rtype: float
         """
-        self.channel_check(channel)
+        return self.measure_all(channel)["voltage"]
+
+    def measure_power(self, channel):
+        """
+        Get the power measurement for the given channel
 
-        meas = self.query_device(f":MEAS? CH{channel}").strip()
-        return float(meas)
+        The instrument reports power in the same :MEAS:ALL? reply as
+        voltage and current, so no extra query is needed.
 
-    def measure_all(self, channel):
+        :param channel: Channel to read power measurement from
+        :type channel: int
+        :return: Power measurement in W
+        :rtype: float
+        """
+        return self.measure_all(channel)["power"]
+
+    def measure_all(self, channel, use_cache=True):
         """
         Get the voltage, current, and power measurements for the channel
 
+        Replies are cached briefly so that pulling voltage, current, and
+        power one after the other issues only one SCPI query. Pass
+        use_cache=False to force a fresh reading.
+
         :param channel: Channel to read measurements from
         :type channel: int
+        :param use_cache: Serve a recent reading if one is fresh enough
+        :type use_cache: bool
         :return: dict
         """
         self.channel_check(channel)
 
-        meas = self.query_device(f":MEAS:ALL? CH{channel}").strip().split(",")
-        return {
+        cache = getattr(self, "_meas_cache", None)
+        if cache is None:
+            cache = self._meas_cache = {}
+        now = time.monotonic()
+        if use_cache:
+            hit = cache.get(channel)
+            if hit is not None and now < hit[1]:
+                return hit[0]
+
+        # "" selects the instrument's current channel, like the other
+        # getters that accept an omitted channel
+        query = _MEAS_ALL_Q.get(channel, ":MEAS:ALL?")
+        meas = self.query_device(query).strip().split(",")
+        result = {
             "voltage": float(meas[0]),
             "current": float(meas[1]),
             "power": float(meas[2]),
         }
+        cache[channel] = (result, now + _MEAS_CACHE_TTL)
+        return result
 
 
 class DP712(DP):
@@ -420,8 +580,8 @@ class DP712(DP):
     Rigol DP712 Programmable Power Supply
     """
 
-    def channel_check(self, channel):
-        assert channel in [1, ""], f"Output channel {channel} not supported"
+    CHANNELS = (1,)
+    _VALID = frozenset(CHANNELS)
 
 
 class DP821(DP):
@@ -429,8 +589,8 @@ class DP821(DP):
     Rigol DP821 Programmable Power Supply
     """
 
-    def channel_check(self, channel):
-        assert channel in [1, 2, ""], f"Output channel {channel} not supported"
+    CHANNELS = (1, 2)
+    _VALID = frozenset(CHANNELS)
 
 
 class DP832(DP):
@@ -438,5 +598,5 @@ class DP832(DP):
     Rigol DP832 Programmable Power Supply
     """
 
-    def channel_check(self, channel):
-        assert channel in [1, 2, 3, ""], f"Output channel {channel} not supported"
+    CHANNELS = (1, 2, 3)
+    _VALID = frozenset(CHANNELS)
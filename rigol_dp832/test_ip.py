@@ -6,46 +6,46 @@ Usage:
     python test_ip.py 192.168.1.100
 """
 
+import re
 import sys
 import os
 
 # Add current directory for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    import pyvisa
-    VISA_AVAILABLE = True
-except ImportError:
-    VISA_AVAILABLE = False
+# Reuse the lazily built, shared ResourceManager; constructing one per
+# probe re-runs VISA backend discovery every time
+from rigol_dp832.find_dp832 import _get_rm
+
+# One precompiled scan for any supported DP-series model, instead of
+# uppercasing the reply and looping over substring checks in Python.
+_DP_RE = re.compile(r"RIGOL.*DP(?:832|821|712)", re.IGNORECASE)
 
 
 def test_ip(ip: str, port: int = 5555) -> str | None:
     """
     Test if a Rigol DP832/DP821/DP712 is at the specified IP address.
-    
+
     Args:
         ip: IP address to test
         port: Port number (default: 5555)
-    
+
     Returns:
         Device ID string if found, None otherwise
     """
-    if not VISA_AVAILABLE:
-        raise ImportError("PyVISA not available. Please install: pip install pyvisa")
-    
+    # Raises ImportError with install instructions if pyvisa is missing
+    rm = _get_rm()
+
     try:
         resource_string = f"TCPIP0::{ip}::{port}::SOCKET"
-        rm = pyvisa.ResourceManager()
         inst = rm.open_resource(resource_string, read_termination="\n", timeout=2000)
-        
+
         # Try to get device ID
         id_response = inst.query("*IDN?")
         inst.close()
-        rm.close()
-        
+
         # Check if it's a Rigol DP series power supply
-        id_upper = id_response.upper()
-        if "RIGOL" in id_upper and any(model in id_upper for model in ["DP832", "DP821", "DP712"]):
+        if _DP_RE.search(id_response):
             return id_response.strip()
         return None
     except Exception: